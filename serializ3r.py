@@ -2,6 +2,7 @@
 import click
 import csv
 import sys
+from itertools import islice
 
 def import_db():
 
@@ -10,7 +11,7 @@ def import_db():
     # Read first five lines and print to user
     
     with open(database_location) as database_file:
-        head = [next(database_file) for x in range(5)]
+        head = list(islice(database_file, 5))
     for i in head:
         print(i)
     
@@ -32,16 +33,21 @@ def convert(db_t, db_location):
     with open(db_location) as db_file:
         if db_t == 1:
             #placeholder
+            pass
         elif db_t == 2:
             #placeholder
+            pass
         else:
             #placeholder
+            pass
 
 def convert_csv(db_t, db_location):
     #placeholder
+    pass
 
 def convert_json(db_t, db_location):
     #placeholder
+    pass
 
 
 if __name__ == '__main__':